@@ -6,17 +6,100 @@ reasoning steps with tool execution to solve problems iteratively.
 """
 
 import re
-import json
-import urllib.request
-import urllib.error
 import os
-from typing import Dict, List, Any, Optional
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import functools
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Deque, Dict, List, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
 
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "30"))
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session with a pooled adapter for repeated calls to one host"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Compiled once at import; these run on every ReAct step.
+# The combined pattern extracts thought and action in a single scan; the
+# action patterns are only consulted when it misses.
+_COMBINED_RE = re.compile(
+    r"Thought:\s*(?P<thought>.*?)\s*Action:\s*(?P<tool>\w+)\s*"
+    r"(?:\[\s*(?P<input>[^\n]*?)\s*\]|\(\s*(?P<paren_input>[^\n]*?)\s*\))",
+    re.IGNORECASE | re.DOTALL
+)
+_ACTION_PATTERNS = [
+    re.compile(r"Action:\s*(?P<tool>\w+)\s*(?:\[(?P<input>.*?)\]|\((?P<paren_input>.*?)\))", re.IGNORECASE),
+    re.compile(r"(?:I'll use|Using) (?P<tool>\w+)(?: with input)?: (?P<input>.*)", re.IGNORECASE)
+]
+_THOUGHT_RE = re.compile(r"Thought:\s*(.*?)(?=Action:|$)", re.IGNORECASE | re.DOTALL)
+# Models often go on to invent the tool's observation; nothing past it is used
+_OBSERVATION_RE = re.compile(r"^\s*Observation:", re.IGNORECASE | re.MULTILINE)
+
+# High-confidence single-intent queries that are answered without the LLM.
+# Anything that looks like a compound request goes to the LLM instead.
+_FAST_COMPOUND_RE = re.compile(r"\b(?:and|then|also)\b|[,;]", re.IGNORECASE)
+_FAST_LIST_RE = re.compile(
+    r"^\s*(?:list|show)(?:\s+me)?(?:\s+(?:all|every))?(?:\s+(?:of\s+)?(?:the|my))?"
+    r"\s+todos?(?:\s+list)?\s*[.!?]?\s*$",
+    re.IGNORECASE
+)
+_FAST_DELETE_RE = re.compile(
+    r"^\s*(?:delete|remove)\s+(?:the\s+)?todo\s+(?:(?:with\s+)?(?:id|number)\s+)?#?(\d+)\s*[.!]?\s*$",
+    re.IGNORECASE
+)
+_FAST_ADD_RE = re.compile(
+    r"^\s*add\s+(?:(?:a|an)\s+)?(?:new\s+)?todo(?:\s+item)?"
+    r"(?:\s+(?:to|for|called|named|titled)\s+|\s*:\s*|\s+)(?!(?:(?:to|the|my)\s+)*lists?\b)['\"]?(.+?)['\"]?\s*[.!]?\s*$",
+    re.IGNORECASE
+)
+
+def _action_from_match(match: re.Match) -> tuple[str, str]:
+    """Return (tool, input) from an action match, whichever bracket style it used"""
+    tool_input = match["input"]
+    if tool_input is None:
+        tool_input = match["paren_input"]
+    return match["tool"].lower(), tool_input.strip()
+
+
+def _keyword_pos(text: str, lowered: str, keyword: str) -> int:
+    """
+    Locate a lowercase keyword with str.find, which is far cheaper than a
+    case-insensitive regex scan. Returns -1 when absent, otherwise a safe
+    position to start the regex search from.
+    """
+    pos = lowered.find(keyword)
+    # lower() can change the length of some non-ASCII text, shifting offsets
+    if pos > 0 and len(lowered) != len(text):
+        return 0
+    return pos
+
+# Last ListTodosTool result per todos URL as (ETag, formatted output).
+# The add/delete tools drop the entry for their URL when they change the list.
+_LIST_CACHE: Dict[str, tuple[str, str]] = {}
+
+# Shared by the todo tools so every tool call reuses the same connection
+_SESSION = _create_session()
+# Separate pool for the LLM host, keeping its TLS connections warm across steps
+_LLM_SESSION = _create_session()
+
 
 class StepType(Enum):
     THOUGHT = "thought"
@@ -34,9 +117,14 @@ class Step:
 class Tool:
     """Base class for tools that the agent can use"""
     
-    def __init__(self, name: str, description: str):
+    # Read-only tools run after the writes that precede them in the same LLM
+    # response, so they observe the effects of those writes
+    read_only = False
+    
+    def __init__(self, name: str, description: str, session: Optional[requests.Session] = None):
         self.name = name
         self.description = description
+        self.session = session or _SESSION
     
     def execute(self, *args, **kwargs) -> str:
         raise NotImplementedError
@@ -45,24 +133,25 @@ class Tool:
 class AddTodoTool(Tool):
     """Tool for adding a new todo item"""
     
-    def __init__(self, api_url="http://localhost:5001"):
+    def __init__(self, api_url="http://localhost:5001", session: Optional[requests.Session] = None):
         super().__init__(
             name="add_todo",
-            description="Add a new todo item. Input should be the title of the todo."
+            description="Add a new todo item. Input should be the title of the todo.",
+            session=session
         )
         self.api_url = api_url
+        self._todos_url = f"{api_url}/todos"
     
     def execute(self, title: str) -> str:
         try:
-            url = f"{self.api_url}/todos"
-            data = json.dumps({"title": title}).encode('utf-8')
+            _LIST_CACHE.pop(self._todos_url, None)
+            response = self.session.post(
+                self._todos_url, data=orjson.dumps({"title": title}), headers=JSON_HEADERS, timeout=HTTP_TIMEOUT
+            )
+            response.raise_for_status()
             
-            req = urllib.request.Request(url, data=data)
-            req.add_header('Content-Type', 'application/json')
-            
-            with urllib.request.urlopen(req) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                return f"Successfully added todo: '{result['title']}' with ID {result['id']}"
+            result = orjson.loads(response.content)
+            return f"Successfully added todo: '{result['title']}' with ID {result['id']}"
         except Exception as e:
             return f"Error adding todo: {str(e)}"
 
@@ -70,26 +159,25 @@ class AddTodoTool(Tool):
 class DeleteTodoTool(Tool):
     """Tool for deleting a todo item"""
     
-    def __init__(self, api_url="http://localhost:5001"):
+    def __init__(self, api_url="http://localhost:5001", session: Optional[requests.Session] = None):
         super().__init__(
             name="delete_todo",
-            description="Delete a todo item. Input should be the ID of the todo to delete."
+            description="Delete a todo item. Input should be the ID of the todo to delete.",
+            session=session
         )
         self.api_url = api_url
+        self._todos_url = f"{api_url}/todos"
     
     def execute(self, todo_id: str) -> str:
         try:
-            # First, try to get the todo to confirm it exists
-            url = f"{self.api_url}/todos/{todo_id}"
-            req = urllib.request.Request(url, method='DELETE')
+            _LIST_CACHE.pop(self._todos_url, None)
+            response = self.session.delete(f"{self._todos_url}/{todo_id}", timeout=HTTP_TIMEOUT)
             
-            with urllib.request.urlopen(req) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                return f"Successfully deleted todo with ID {todo_id}"
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
+            if response.status_code == 404:
                 return f"Todo with ID {todo_id} not found"
-            return f"Error deleting todo: HTTP {e.code}"
+            if not response.ok:
+                return f"Error deleting todo: HTTP {response.status_code}"
+            return f"Successfully deleted todo with ID {todo_id}"
         except Exception as e:
             return f"Error deleting todo: {str(e)}"
 
@@ -97,44 +185,225 @@ class DeleteTodoTool(Tool):
 class ListTodosTool(Tool):
     """Tool for listing all todos"""
     
-    def __init__(self, api_url="http://localhost:5001"):
+    read_only = True
+    
+    def __init__(self, api_url="http://localhost:5001", session: Optional[requests.Session] = None):
         super().__init__(
             name="list_todos",
-            description="List all todo items. No input required."
+            description="List all todo items. No input required.",
+            session=session
         )
         self.api_url = api_url
+        self._todos_url = f"{api_url}/todos"
     
     def execute(self, query: str = "") -> str:
         try:
-            url = f"{self.api_url}/todos"
-            req = urllib.request.Request(url)
+            # Revalidate the previous result; the server answers 304 if unchanged
+            cached = _LIST_CACHE.get(self._todos_url)
+            headers = {"If-None-Match": cached[0]} if cached else None
+            response = self.session.get(self._todos_url, headers=headers, timeout=HTTP_TIMEOUT)
+            if response.status_code == 304 and cached:
+                return cached[1]
+            response.raise_for_status()
             
-            with urllib.request.urlopen(req) as response:
-                todos = json.loads(response.read().decode('utf-8'))
-                
-                if not todos:
-                    return "No todos found. The list is empty."
-                
-                todo_list = []
-                for todo in todos:
-                    status = "✓" if todo.get('completed', False) else "○"
-                    todo_list.append(f"{status} [{todo['id']}] {todo['title']}")
-                
-                return "Current todos:\n" + "\n".join(todo_list)
+            result = self._format_todos(orjson.loads(response.content))
+            etag = response.headers.get("ETag")
+            if etag:
+                _LIST_CACHE[self._todos_url] = (etag, result)
+            return result
         except Exception as e:
             return f"Error listing todos: {str(e)}"
+    
+    @staticmethod
+    def _format_todos(todos: List[Dict[str, Any]]) -> str:
+        if not todos:
+            return "No todos found. The list is empty."
+        
+        todo_list = []
+        for todo in todos:
+            status = "✓" if todo.get('completed', False) else "○"
+            todo_list.append(f"{status} [{todo['id']}] {todo['title']}")
+        
+        return "Current todos:\n" + "\n".join(todo_list)
+
+
+class AddTodoToolDirect(AddTodoTool):
+    """
+    In-process variant of AddTodoTool that calls a todo store directly,
+    for agents running in the same process as the todo API
+    """
+    
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+    
+    def execute(self, title: str) -> str:
+        try:
+            result = self.store.create_todo(title)
+            return f"Successfully added todo: '{result['title']}' with ID {result['id']}"
+        except Exception as e:
+            return f"Error adding todo: {str(e)}"
+
+
+class DeleteTodoToolDirect(DeleteTodoTool):
+    """In-process variant of DeleteTodoTool that calls a todo store directly"""
+    
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+    
+    def execute(self, todo_id: str) -> str:
+        try:
+            if not self.store.delete_todo(int(todo_id)):
+                return f"Todo with ID {todo_id} not found"
+            return f"Successfully deleted todo with ID {todo_id}"
+        except Exception as e:
+            return f"Error deleting todo: {str(e)}"
+
+
+class ListTodosToolDirect(ListTodosTool):
+    """In-process variant of ListTodosTool that reads a todo store directly"""
+    
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+    
+    def execute(self, query: str = "") -> str:
+        try:
+            return self._format_todos(self.store.list_todos())
+        except Exception as e:
+            return f"Error listing todos: {str(e)}"
+
+
+class ResponseCache:
+    """
+    Two-level exact-match cache for LLM responses: an in-memory LRU in front
+    of a SQLite table, keyed by a hash of the chat messages. The table keeps
+    the max_rows most recently stored responses.
+    """
+    
+    def __init__(self, path: Optional[str] = None, maxsize: int = 512, max_rows: int = 10000):
+        self.path = path or os.getenv("LLM_CACHE_FILE", "llm_cache.sqlite3")
+        self.maxsize = maxsize
+        self.max_rows = max_rows
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+    
+    @staticmethod
+    def make_key(messages: List[Dict[str, str]], model: str = "", temperature: float = 0.0,
+                 stop: Optional[str] = None) -> str:
+        """Hash the request (messages, model, temperature and stop mode) into a stable cache key"""
+        request = {"messages": messages, "model": model, "temperature": temperature, "stop": stop}
+        return hashlib.blake2b(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    
+    def _connection(self) -> sqlite3.Connection:
+        # Opened lazily so importing the module never touches the disk
+        if self._db is None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, response TEXT)")
+            self._db.commit()
+        return self._db
+    
+    def _remember(self, key: str, response: str):
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+            try:
+                row = self._connection().execute(
+                    "SELECT response FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+            if row is None:
+                return None
+            self._remember(key, row[0])
+            return row[0]
+    
+    def put(self, key: str, response: str):
+        with self._lock:
+            self._remember(key, response)
+            try:
+                db = self._connection()
+                db.execute("INSERT OR REPLACE INTO cache (key, response) VALUES (?, ?)", (key, response))
+                # REPLACE gives the row a new rowid, so the lowest rowids are the oldest
+                db.execute(
+                    "DELETE FROM cache WHERE rowid IN "
+                    "(SELECT rowid FROM cache ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                    (self.max_rows,)
+                )
+                db.commit()
+            except sqlite3.Error:
+                pass
+    
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            try:
+                db = self._connection()
+                db.execute("DELETE FROM cache")
+                db.commit()
+            except sqlite3.Error:
+                pass
+
+
+def cached_completion(func):
+    """
+    Decorator serving chat_completion calls from the client's ResponseCache.
+    Sampled calls (temperature > 0) bypass the cache unless the client opts in
+    with cache_sampled=True. Empty (failed) responses are never stored.
+    """
+    @functools.wraps(func)
+    def wrapper(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+                stop_pattern: Optional[re.Pattern] = None) -> str:
+        cache = self.cache
+        if cache is None or (temperature > 0 and not self.cache_sampled):
+            return func(self, messages, temperature, stop_pattern=stop_pattern)
+        
+        # Streamed responses cut off at a stop pattern differ from full ones
+        stop = stop_pattern.pattern if stop_pattern is not None else None
+        key = cache.make_key(messages, self.model, temperature, stop)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        
+        response = func(self, messages, temperature, stop_pattern=stop_pattern)
+        if response:
+            cache.put(key, response)
+        return response
+    return wrapper
+
+
+# Shared across clients so agents built per request still hit the same cache
+_RESPONSE_CACHE = ResponseCache()
 
 
 class MistralLLMClient:
     """Client for Mistral API (OpenAI compatible)"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None, use_cache: bool = True,
+                 cache_sampled: bool = False, cache: Optional[ResponseCache] = None):
         self.base_url = "https://mistral-llm.apps.cluster-gg696.gg696.sandbox3157.opentlc.com/v1"
         self.api_key = os.getenv("API_KEY", "")
         self.model = "mistral"
+        self.session = session or _LLM_SESSION
+        self.cache = (cache or _RESPONSE_CACHE) if use_cache else None
+        self.cache_sampled = cache_sampled
     
-    def chat_completion(self, messages: List[Dict[str, str]], temperature: float = 0.7) -> str:
-        """Make a chat completion request to Mistral API"""
+    @cached_completion
+    def chat_completion(self, messages: List[Dict[str, str]], temperature: float = 0.7,
+                        stop_pattern: Optional[re.Pattern] = None) -> str:
+        """
+        Make a chat completion request to Mistral API. With a stop_pattern the
+        response is streamed and reading stops as soon as the text matches it.
+        """
         url = f"{self.base_url}/chat/completions"
         
         payload = {
@@ -144,20 +413,53 @@ class MistralLLMClient:
             "max_tokens": 500
         }
         
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(url, data=data)
-        req.add_header('Content-Type', 'application/json')
-        
+        headers = dict(JSON_HEADERS)
         if self.api_key:
-            req.add_header('Authorization', f'Bearer {self.api_key}')
+            headers['Authorization'] = f'Bearer {self.api_key}'
+        
+        if stop_pattern is not None:
+            return self._stream_completion(url, payload, headers, stop_pattern)
+        
+        try:
+            response = self.session.post(url, data=orjson.dumps(payload), headers=headers, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            
+            result = orjson.loads(response.content)
+            if "choices" in result and len(result["choices"]) > 0:
+                return result["choices"][0]["message"]["content"]
+            return ""
+        except Exception as e:
+            print(f"Error calling Mistral API: {e}")
+            return ""
+    
+    def _stream_completion(self, url: str, payload: Dict[str, Any], headers: Dict[str, str],
+                           stop_pattern: re.Pattern) -> str:
+        """Stream a completion over SSE, closing the connection once stop_pattern matches"""
+        payload = dict(payload, stream=True)
+        content = ""
         
         try:
-            with urllib.request.urlopen(req) as response:
-                result = json.loads(response.read().decode('utf-8'))
+            with self.session.post(url, data=orjson.dumps(payload), headers=headers,
+                                   timeout=HTTP_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
                 
-                if "choices" in result and len(result["choices"]) > 0:
-                    return result["choices"][0]["message"]["content"]
-                return ""
+                for line in response.iter_lines():
+                    if not line.startswith(b"data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == b"[DONE]":
+                        break
+                    
+                    chunk = orjson.loads(data)
+                    if not chunk.get("choices"):
+                        continue
+                    delta = chunk["choices"][0].get("delta", {}).get("content")
+                    if delta:
+                        content += delta
+                        # Everything after the match would be discarded anyway
+                        if stop_pattern.search(content):
+                            break
+            return content
         except Exception as e:
             print(f"Error calling Mistral API: {e}")
             return ""
@@ -169,12 +471,39 @@ class ReActAgent:
     to solve problems step by step.
     """
     
-    def __init__(self, tools: List[Tool], llm_client=None, max_steps: int = 10, verbose: bool = True):
+    def __init__(self, tools: List[Tool], llm_client=None, max_steps: int = 10, verbose: bool = True,
+                 fast_path: bool = True, temperature: float = 0.0):
         self.tools = {tool.name: tool for tool in tools}
         self.llm_client = llm_client or MistralLLMClient()
         self.max_steps = max_steps
+        # Greedy decoding keeps steps reproducible, which also lets the
+        # client's response cache serve repeated prompts
+        self.temperature = temperature
+        self.fast_path = fast_path
         self.verbose = verbose
+        # Bounded by max_steps, with one thought, its actions and one observation per step
         self.history: List[Step] = []
+        self._last_observation: Optional[str] = None
+        # Pre-rendered lines for the most recent steps, fed to the next prompt
+        self._context_lines: Deque[str] = deque(maxlen=6)
+        # Tool calls are I/O bound, so multiple actions from one LLM response
+        # run in parallel; TOOL_CONCURRENCY_LIMIT=1 keeps them sequential
+        concurrency = int(os.getenv("TOOL_CONCURRENCY_LIMIT", "4"))
+        self._pool = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+        # Streamed LLM responses are cut off once the parser has what it needs:
+        # the first action when running sequentially, otherwise every action
+        # up to an invented observation
+        self._stream_stop_re = _COMBINED_RE if self._pool is None else _OBSERVATION_RE
+        # Tools never change after construction, so the system prompt stays
+        # byte-identical across calls and prefix/prompt caches can hit
+        self._tools_description = self._get_tools_description()
+        self._system_prompt = self._generate_system_prompt()
+        # Only known tool names can match, so non-tool words are rejected early
+        tool_names = "|".join(map(re.escape, self.tools))
+        self._strict_action_re = re.compile(
+            rf"Action:\s*(?P<tool>{tool_names})\s*(?:\[(?P<input>.*?)\]|\((?P<paren_input>.*?)\))",
+            re.IGNORECASE
+        ) if self.tools else None
     
     def _get_tools_description(self) -> str:
         """Generate a description of available tools"""
@@ -183,64 +512,134 @@ class ReActAgent:
             descriptions.append(f"- {tool.name}: {tool.description}")
         return "\n".join(descriptions)
     
-    def _parse_action(self, text: str) -> Optional[tuple[str, str]]:
+    def _generate_system_prompt(self) -> str:
+        """Generate the static part of the prompt shared by every LLM call"""
+        return f"""You are a ReAct agent that helps manage a todo list application.
+
+Available tools:
+{self._tools_description}
+
+To use a tool, format your response EXACTLY as:
+Thought: [your reasoning about what to do next]
+Action: tool_name[input]
+
+After receiving an observation, think again and either use another tool or provide the final answer.
+Always reply with your next thought and action, formatted as:
+Thought: [reasoning]
+Action: tool_name[input]
+"""
+    
+    def _parse_action(self, text: str, lowered: Optional[str] = None) -> Optional[tuple[str, str]]:
         """Parse action from text in format: Action: tool_name[input]"""
-        action_patterns = [
-            r"Action:\s*(\w+)\[(.*?)\]",
-            r"Action:\s*(\w+)\((.*?)\)",
-            r"I'll use (\w+) with input: (.*)",
-            r"Using (\w+): (.*)"
-        ]
+        lowered = text.lower() if lowered is None else lowered
         
-        for pattern in action_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        start = _keyword_pos(text, lowered, "action:")
+        if start >= 0:
+            if self._strict_action_re is not None:
+                match = self._strict_action_re.search(text, start)
+                if match:
+                    return _action_from_match(match)
+            
+            match = _ACTION_PATTERNS[0].search(text, start)
             if match:
-                return match.group(1).lower(), match.group(2).strip()
+                return _action_from_match(match)
+        
+        if "i'll use " in lowered or "using " in lowered:
+            match = _ACTION_PATTERNS[1].search(text)
+            if match:
+                return _action_from_match(match)
         return None
     
+    def _parse_step(self, text: str) -> tuple[Optional[str], List[tuple[str, str]]]:
+        """
+        Parse the thought and actions from an LLM response, in one pass when
+        possible. Any further Action lines after the first are returned too,
+        up to the first Observation line, which the model made up itself.
+        """
+        observation = _OBSERVATION_RE.search(text)
+        if observation:
+            text = text[:observation.start()]
+        lowered = text.lower()
+        thought = None
+        
+        start = _keyword_pos(text, lowered, "thought:")
+        if start >= 0:
+            match = _COMBINED_RE.search(text, start)
+            if match:
+                actions = [_action_from_match(match)]
+                for extra in _ACTION_PATTERNS[0].finditer(text, match.end()):
+                    actions.append(_action_from_match(extra))
+                return match["thought"].strip(), actions
+            
+            thought = _THOUGHT_RE.search(text, start).group(1).strip()
+        
+        action = self._parse_action(text, lowered)
+        return thought, [action] if action else []
+    
     def _execute_action(self, tool_name: str, tool_input: str) -> str:
         """Execute a tool and return the observation"""
         if tool_name in self.tools:
             return self.tools[tool_name].execute(tool_input)
         return f"Error: Tool '{tool_name}' not found"
     
-    def _generate_prompt(self, question: str) -> str:
-        """Generate prompt for the LLM"""
-        context = self._create_context()
+    def _execute_actions(self, actions: List[tuple[str, str]]) -> List[str]:
+        """
+        Execute tools, returning observations in action order. Consecutive
+        reads (read-only tools) or writes form a segment; segments run in
+        order, the actions within one concurrently when allowed.
+        """
+        if self._pool is None or len(actions) == 1:
+            return [self._execute_action(tool_name, tool_input) for tool_name, tool_input in actions]
         
-        prompt = f"""You are a ReAct agent that helps manage a todo list application.
-
-Available tools:
-{self._get_tools_description()}
-
-To use a tool, format your response EXACTLY as:
-Thought: [your reasoning about what to do next]
-Action: tool_name[input]
-
-After receiving an observation, think again and either use another tool or provide the final answer.
-
-Question: {question}
-
-{context}
-
-What is your next thought and action? Remember to format as:
-Thought: [reasoning]
-Action: tool_name[input]
-"""
-        return prompt
+        observations = [""] * len(actions)
+        segments: List[List[int]] = []
+        last_read_only = None
+        for index, (tool_name, _) in enumerate(actions):
+            read_only = getattr(self.tools.get(tool_name), "read_only", False)
+            if read_only != last_read_only:
+                segments.append([])
+                last_read_only = read_only
+            segments[-1].append(index)
+        
+        for segment in segments:
+            futures = {self._pool.submit(self._execute_action, *actions[index]): index for index in segment}
+            for future in as_completed(futures):
+                observations[futures[future]] = future.result()
+        return observations
+    
+    def _generate_prompt(self, question: str) -> str:
+        """Generate the dynamic part of the prompt: the question and recent steps"""
+        return f"Question: {question}\n{self._create_context()}"
     
     def _call_llm(self, question: str) -> str:
         """Call the LLM to generate the next step"""
-        prompt = self._generate_prompt(question)
-        
         messages = [
-            {"role": "system", "content": "You are a helpful ReAct agent that manages todos."},
-            {"role": "user", "content": prompt}
+            {"role": "system", "content": self._system_prompt},
+            {"role": "user", "content": self._generate_prompt(question)}
         ]
         
-        response = self.llm_client.chat_completion(messages)
+        response = self.llm_client.chat_completion(
+            messages, temperature=self.temperature, stop_pattern=self._stream_stop_re
+        )
         return response if response else self._fallback_response(question)
     
+    def _try_fast_path(self, question: str) -> Optional[str]:
+        """Build the LLM-style response locally for simple list/delete/add requests"""
+        if _FAST_COMPOUND_RE.search(question):
+            return None
+        
+        if "list_todos" in self.tools and _FAST_LIST_RE.search(question):
+            return "Thought: I need to list all todos.\nAction: list_todos[]"
+        
+        match = _FAST_DELETE_RE.search(question)
+        if match and "delete_todo" in self.tools:
+            return f"Thought: I need to delete todo {match.group(1)}.\nAction: delete_todo[{match.group(1)}]"
+        
+        match = _FAST_ADD_RE.search(question)
+        if match and "add_todo" in self.tools:
+            return f"Thought: I need to add a new todo item.\nAction: add_todo[{match.group(1)}]"
+        return None
+    
     def _fallback_response(self, question: str) -> str:
         """Fallback response when LLM is not available"""
         if "add" in question.lower():
@@ -263,78 +662,85 @@ Action: tool_name[input]
             print("-" * 50)
         
         for step_num in range(self.max_steps):
+            # Simple requests skip the LLM round-trip entirely
+            fast_response = self._try_fast_path(question) if self.fast_path and step_num == 0 else None
+            
             # Generate thought and action from LLM
-            llm_response = self._call_llm(question)
+            llm_response = fast_response or self._call_llm(question)
             
-            # Extract thought
-            thought_match = re.search(r"Thought:\s*(.*?)(?=Action:|$)", llm_response, re.IGNORECASE | re.DOTALL)
-            if thought_match:
-                thought = thought_match.group(1).strip()
-                self.history.append(Step(StepType.THOUGHT, thought))
+            # Extract thought and actions
+            thought, actions = self._parse_step(llm_response)
+            if thought is not None:
+                self._add_step(StepType.THOUGHT, thought)
                 if self.verbose:
                     print(f"Thought {step_num + 1}: {thought}")
             
-            # Parse and execute action
-            action_parsed = self._parse_action(llm_response)
-            
-            if action_parsed:
-                tool_name, tool_input = action_parsed
-                action_str = f"{tool_name}[{tool_input}]"
-                self.history.append(Step(StepType.ACTION, action_str))
-                
-                if self.verbose:
-                    print(f"Action {step_num + 1}: {action_str}")
+            if actions:
+                for tool_name, tool_input in actions:
+                    action_str = f"{tool_name}[{tool_input}]"
+                    self._add_step(StepType.ACTION, action_str)
+                    
+                    if self.verbose:
+                        print(f"Action {step_num + 1}: {action_str}")
                 
-                # Execute tool and get observation
-                observation = self._execute_action(tool_name, tool_input)
-                self.history.append(Step(StepType.OBSERVATION, observation))
+                # Execute tools and combine their results into one observation
+                observation = "\n".join(self._execute_actions(actions))
+                self._add_step(StepType.OBSERVATION, observation)
+                self._last_observation = observation
                 
                 if self.verbose:
                     print(f"Observation {step_num + 1}: {observation}")
                     print("-" * 30)
                 
                 # Check if task is complete
-                if "successfully" in observation.lower() or step_num >= self.max_steps - 2:
+                if fast_response or "successfully" in observation.lower() or step_num >= self.max_steps - 2:
                     answer = self._generate_answer(question)
-                    self.history.append(Step(StepType.ANSWER, answer))
+                    self._add_step(StepType.ANSWER, answer)
                     if self.verbose:
                         print(f"Answer: {answer}")
                     return {"answer": answer, "history": self.get_history_dict()}
             else:
                 # No action found, generate final answer
                 answer = self._generate_answer(question)
-                self.history.append(Step(StepType.ANSWER, answer))
+                self._add_step(StepType.ANSWER, answer)
                 if self.verbose:
                     print(f"Answer: {answer}")
                 return {"answer": answer, "history": self.get_history_dict()}
         
         # Max steps reached
         answer = "I've reached the maximum number of steps. " + self._generate_answer(question)
-        self.history.append(Step(StepType.ANSWER, answer))
+        self._add_step(StepType.ANSWER, answer)
         return {"answer": answer, "history": self.get_history_dict()}
     
+    async def arun(self, question: str) -> Dict[str, Any]:
+        """
+        Awaitable version of run() for asyncio applications. The blocking
+        loop runs in a worker thread so the event loop can serve other
+        agents while this one waits on the LLM and tools.
+        """
+        return await asyncio.to_thread(self.run, question)
+    
     def _generate_answer(self, question: str) -> str:
         """Generate final answer based on the history"""
-        observations = [step.content for step in self.history 
-                       if step.type == StepType.OBSERVATION]
+        last_observation = self._last_observation
         
-        if observations:
-            last_observation = observations[-1]
+        if last_observation is not None:
             if "successfully" in last_observation.lower():
                 return last_observation
             return f"Based on my actions: {last_observation}"
         
         return "I couldn't complete the requested task."
     
+    def _add_step(self, step_type: StepType, content: str):
+        """Record a step in the history and render its context line once"""
+        self.history.append(Step(step_type, content))
+        self._context_lines.append(f"{step_type.value.capitalize()}: {content}")
+    
     def _create_context(self) -> str:
-        """Create context from history for the next thought"""
-        if not self.history:
+        """Create context from the last 6 steps for the next thought"""
+        if not self._context_lines:
             return ""
-        
-        context_parts = ["Previous steps:"]
-        for step in self.history[-6:]:  # Last 6 steps for context
-            context_parts.append(f"{step.type.value.capitalize()}: {step.content}")
-        return "\n".join(context_parts)
+        return "Previous steps:\n" + "\n".join(self._context_lines)
     
     def get_history_dict(self) -> List[Dict[str, str]]:
         """Return the history as a list of dictionaries"""
@@ -342,7 +748,9 @@ Action: tool_name[input]
     
     def reset(self):
         """Reset the agent's history"""
-        self.history = []
+        self.history.clear()
+        self._last_observation = None
+        self._context_lines.clear()
 
 
 def main():
@@ -1,37 +1,65 @@
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from dotenv import load_dotenv
-import json
+import orjson
 import os
 import sys
-from datetime import datetime
+import queue
+
+import todo_store
 
 # Add parent directory to path to import agent
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from agent.react_agent import ReActAgent, AddTodoTool, DeleteTodoTool, ListTodosTool
+from agents.react_agent import ReActAgent, AddTodoToolDirect, DeleteTodoToolDirect, ListTodosToolDirect
 
 load_dotenv()
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster request/response encoding"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
-TODOS_FILE = os.getenv('TODOS_FILE', 'todos.json')
 PORT = int(os.getenv('PORT', 5000))
 
-def load_todos():
-    if os.path.exists(TODOS_FILE):
-        with open(TODOS_FILE, 'r') as f:
-            return json.load(f)
-    return []
+# The agent runs in this process, so its tools call the todo store directly
+# instead of looping back through HTTP
+AGENT_TOOLS = [
+    AddTodoToolDirect(todo_store),
+    DeleteTodoToolDirect(todo_store),
+    ListTodosToolDirect(todo_store)
+]
+AGENT_POOL_SIZE = int(os.getenv('AGENT_POOL_SIZE', 4))
 
-def save_todos(todos):
-    with open(TODOS_FILE, 'w') as f:
-        json.dump(todos, f, indent=2)
+# Pre-built agents handed out per request and reset between runs, so the
+# tools and system prompt are only built once. When every pooled agent is
+# busy a new one is built rather than making the request wait; at most
+# AGENT_POOL_SIZE idle agents are kept.
+_AGENT_POOL = queue.Queue(maxsize=AGENT_POOL_SIZE)
+for _ in range(AGENT_POOL_SIZE):
+    _AGENT_POOL.put(ReActAgent(AGENT_TOOLS, verbose=False))
+
+def _acquire_agent():
+    try:
+        return _AGENT_POOL.get_nowait()
+    except queue.Empty:
+        return ReActAgent(AGENT_TOOLS, verbose=False)
 
-def get_next_id(todos):
-    if not todos:
-        return 1
-    return max(todo['id'] for todo in todos) + 1
+def _release_agent(agent):
+    try:
+        _AGENT_POOL.put_nowait(agent)
+    except queue.Full:
+        pass
 
 @app.route('/')
 def index():
@@ -51,13 +79,17 @@ def index():
 
 @app.route('/todos', methods=['GET'])
 def get_todos():
-    todos = load_todos()
-    return jsonify(todos)
+    body, etag = todo_store.snapshot()
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response
 
 @app.route('/todos/<int:id>', methods=['GET'])
 def get_todo(id):
-    todos = load_todos()
-    todo = next((t for t in todos if t['id'] == id), None)
+    todo = todo_store.get_todo(id)
     if todo:
         return jsonify(todo)
     return jsonify({'error': 'Todo not found'}), 404
@@ -69,42 +101,24 @@ def create_todo():
     if not data or 'title' not in data:
         return jsonify({'error': 'Title is required'}), 400
     
-    todos = load_todos()
-    new_todo = {
-        'id': get_next_id(todos),
-        'title': data['title'],
-        'completed': data.get('completed', False),
-        'created_at': datetime.now().isoformat()
-    }
-    
-    todos.append(new_todo)
-    save_todos(todos)
-    
+    new_todo = todo_store.create_todo(data['title'], data.get('completed', False))
     return jsonify(new_todo), 201
 
 @app.route('/todos/<int:id>', methods=['PUT'])
 def update_todo(id):
-    todos = load_todos()
-    todo = next((t for t in todos if t['id'] == id), None)
+    data = request.get_json()
+    todo = todo_store.update_todo(id, data)
     
     if not todo:
         return jsonify({'error': 'Todo not found'}), 404
     
-    data = request.get_json()
-    if 'title' in data:
-        todo['title'] = data['title']
-    if 'completed' in data:
-        todo['completed'] = data['completed']
-    
-    save_todos(todos)
     return jsonify(todo)
 
 @app.route('/todos/<int:id>', methods=['DELETE'])
 def delete_todo(id):
-    todos = load_todos()
-    todos = [t for t in todos if t['id'] != id]
-    save_todos(todos)
-    return jsonify({'message': 'Todo deleted'}), 200
+    if not todo_store.delete_todo(id):
+        return jsonify({'error': 'Todo not found'}), 404
+    return '', 204
 
 @app.route('/agent/execute', methods=['POST'])
 def execute_agent():
@@ -116,17 +130,11 @@ def execute_agent():
     
     query = data['query']
     
-    # Initialize tools and agent
-    tools = [
-        AddTodoTool(api_url=f"http://localhost:{PORT}"),
-        DeleteTodoTool(api_url=f"http://localhost:{PORT}"),
-        ListTodosTool(api_url=f"http://localhost:{PORT}")
-    ]
-    
-    agent = ReActAgent(tools, verbose=False)
+    agent = _acquire_agent()
     
     try:
         # Run the agent
+        agent.reset()
         result = agent.run(query)
         
         return jsonify({
@@ -140,6 +148,8 @@ def execute_agent():
             'success': False,
             'error': str(e)
         }), 500
+    finally:
+        _release_agent(agent)
 
 if __name__ == '__main__':
     app.run(debug=os.getenv('FLASK_DEBUG', 'True').lower() == 'true', port=PORT)
\ No newline at end of file
@@ -0,0 +1,17 @@
+"""
+Gunicorn settings for running the app in production:
+
+    cd app && gunicorn -c gunicorn.conf.py app:app
+
+Gevent workers multiplex the agent's LLM and tool HTTP waits, so many
+/agent/execute requests can be in flight at once.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+worker_class = "gevent"
+# The todo store lives in process memory, so keep a single worker
+workers = 1
+worker_connections = int(os.getenv('WORKER_CONNECTIONS', 200))
+timeout = 120
@@ -0,0 +1,168 @@
+"""
+In-memory todo store shared by the Flask routes and the in-process agent tools.
+
+Todos are loaded from TODOS_FILE once at import. Mutations happen under
+_STORE_LOCK and flag _DIRTY; a background thread writes the file back.
+"""
+
+import os
+import time
+import hashlib
+import atexit
+import threading
+from datetime import datetime
+from typing import Optional
+
+import orjson
+from dotenv import load_dotenv
+
+load_dotenv()
+
+TODOS_FILE = os.getenv('TODOS_FILE', 'todos.json')
+SAVE_DELAY = float(os.getenv('TODOS_SAVE_DELAY', 0.2))
+
+_TODOS: list = []
+_TODOS_BY_ID: dict[int, dict] = {}
+_TODOS_STALE = False
+# Next id to hand out; ids only ever increase, even after deletions
+_NEXT_ID = 1
+# Serialized list and its ETag, rebuilt on the first read after a mutation
+_SNAPSHOT: Optional[tuple[bytes, str]] = None
+_STORE_LOCK = threading.Lock()
+_DIRTY = threading.Event()
+# Serializes file writes between the writer thread and the exit flush
+_WRITE_LOCK = threading.Lock()
+
+def load_todos():
+    if os.path.exists(TODOS_FILE):
+        with open(TODOS_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    return []
+
+def save_todos(todos):
+    # Write to a temp file and swap it in so readers never see a partial file
+    tmp_file = f"{TODOS_FILE}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(todos, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, TODOS_FILE)
+
+def list_todos() -> list:
+    """Return a snapshot of all todos in creation order"""
+    with _STORE_LOCK:
+        return list(_current_todos())
+
+def snapshot() -> tuple[bytes, str]:
+    """Return the JSON-encoded todo list and its ETag, cached until the next change"""
+    global _SNAPSHOT
+    with _STORE_LOCK:
+        if _SNAPSHOT is None:
+            body = orjson.dumps(_current_todos())
+            _SNAPSHOT = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+        return _SNAPSHOT
+
+def get_todo(todo_id: int) -> Optional[dict]:
+    return _TODOS_BY_ID.get(todo_id)
+
+def create_todo(title: str, completed: bool = False) -> dict:
+    global _NEXT_ID
+    with _STORE_LOCK:
+        todos = _current_todos()
+        new_todo = {
+            'id': _NEXT_ID,
+            'title': title,
+            'completed': completed,
+            'created_at': datetime.now().isoformat()
+        }
+        
+        _NEXT_ID += 1
+        todos.append(new_todo)
+        _TODOS_BY_ID[new_todo['id']] = new_todo
+        _mark_changed()
+        return new_todo
+
+def update_todo(todo_id: int, data: dict) -> Optional[dict]:
+    with _STORE_LOCK:
+        todo = _TODOS_BY_ID.get(todo_id)
+        if not todo:
+            return None
+        
+        if 'title' in data:
+            todo['title'] = data['title']
+        if 'completed' in data:
+            todo['completed'] = data['completed']
+        
+        _mark_changed()
+        return todo
+
+def delete_todo(todo_id: int) -> bool:
+    """Delete a todo, returning whether it existed"""
+    global _TODOS_STALE
+    with _STORE_LOCK:
+        if _TODOS_BY_ID.pop(todo_id, None) is None:
+            return False
+        _TODOS_STALE = True
+        _mark_changed()
+        return True
+
+def _mark_changed():
+    """Drop the cached snapshot and schedule a write. Call with _STORE_LOCK held."""
+    global _SNAPSHOT
+    _SNAPSHOT = None
+    _DIRTY.set()
+
+def _current_todos():
+    """Return the todo list, rebuilding it after deletions. Call with _STORE_LOCK held."""
+    global _TODOS, _TODOS_STALE
+    if _TODOS_STALE:
+        _TODOS = list(_TODOS_BY_ID.values())
+        _TODOS_STALE = False
+    return _TODOS
+
+def _flush_todos():
+    # Snapshot under the lock, then do the slow file write without holding it
+    with _STORE_LOCK:
+        todos = [dict(todo) for todo in _current_todos()]
+    save_todos(todos)
+
+def _flush_pending():
+    """Write the store if it changed, flagging it dirty again if the write fails"""
+    with _WRITE_LOCK:
+        _DIRTY.clear()
+        try:
+            _flush_todos()
+        except Exception:
+            _DIRTY.set()
+            raise
+
+def _writer_loop():
+    while True:
+        _DIRTY.wait()
+        # Debounce so a burst of mutations results in a single write
+        time.sleep(SAVE_DELAY)
+        try:
+            _flush_pending()
+        except Exception as e:
+            print(f"Error saving todos: {e}")
+
+def _flush_on_exit():
+    # Waits for an in-progress write, then always writes the final state
+    with _WRITE_LOCK:
+        _DIRTY.clear()
+        _flush_todos()
+
+def _load():
+    global _TODOS, _TODOS_STALE, _SNAPSHOT, _NEXT_ID
+    with _STORE_LOCK:
+        _TODOS = load_todos()
+        _TODOS_BY_ID.clear()
+        _TODOS_BY_ID.update((todo['id'], todo) for todo in _TODOS)
+        _NEXT_ID = max(_TODOS_BY_ID, default=0) + 1
+        _TODOS_STALE = False
+        _SNAPSHOT = None
+
+def _load_once():
+    _load()
+    threading.Thread(target=_writer_loop, name='todos-writer', daemon=True).start()
+    atexit.register(_flush_on_exit)
+
+_load_once()
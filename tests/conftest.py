@@ -0,0 +1,33 @@
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'app'))
+
+# Keep the store and LLM cache away from the checked-in files
+_TMP_DIR = tempfile.mkdtemp()
+os.environ['TODOS_FILE'] = os.path.join(_TMP_DIR, 'todos.json')
+os.environ['LLM_CACHE_FILE'] = os.path.join(_TMP_DIR, 'llm_cache.sqlite3')
+
+import orjson
+import pytest
+
+SEED_TODOS = [
+    {'id': 1, 'title': 'first', 'completed': False, 'created_at': '2025-01-01T00:00:00'},
+    {'id': 2, 'title': 'second', 'completed': True, 'created_at': '2025-01-02T00:00:00'},
+]
+
+
+@pytest.fixture
+def store():
+    """The todo store, reloaded from a fresh copy of SEED_TODOS"""
+    import todo_store
+    
+    with todo_store._WRITE_LOCK:
+        todo_store._DIRTY.clear()
+        with open(os.environ['TODOS_FILE'], 'wb') as f:
+            f.write(orjson.dumps(SEED_TODOS))
+        todo_store._load()
+    return todo_store
@@ -0,0 +1,55 @@
+import pytest
+
+from agents.react_agent import DeleteTodoToolDirect
+
+
+@pytest.fixture
+def client(store):
+    import app
+    return app.app.test_client()
+
+
+def test_get_todos_returns_etag_and_304_when_unchanged(client):
+    response = client.get('/todos')
+    etag = response.headers['ETag']
+    
+    assert response.status_code == 200
+    assert [todo['id'] for todo in response.get_json()] == [1, 2]
+    
+    cached = client.get('/todos', headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.data == b''
+    assert cached.headers['ETag'] == etag
+
+
+def test_get_todos_returns_new_body_after_change(client):
+    etag = client.get('/todos').headers['ETag']
+    client.post('/todos', json={'title': 'third'})
+    
+    response = client.get('/todos', headers={'If-None-Match': etag})
+    
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert [todo['title'] for todo in response.get_json()] == ['first', 'second', 'third']
+
+
+def test_delete_todo_returns_204(client):
+    response = client.delete('/todos/1')
+    
+    assert response.status_code == 204
+    assert response.data == b''
+    assert client.get('/todos/1').status_code == 404
+
+
+def test_delete_missing_todo_returns_404(client):
+    response = client.delete('/todos/99')
+    
+    assert response.status_code == 404
+    assert response.get_json() == {'error': 'Todo not found'}
+
+
+def test_direct_delete_tool_reports_missing_todo(store):
+    tool = DeleteTodoToolDirect(store)
+    
+    assert tool.execute('1') == 'Successfully deleted todo with ID 1'
+    assert tool.execute('1') == 'Todo with ID 1 not found'
@@ -0,0 +1,245 @@
+import time
+
+import orjson
+import pytest
+import requests
+
+from agents import react_agent
+from agents.react_agent import AddTodoTool, DeleteTodoTool, ListTodosTool, ReActAgent, ResponseCache
+
+
+@pytest.fixture
+def agent():
+    tools = [AddTodoTool(), DeleteTodoTool(), ListTodosTool()]
+    return ReActAgent(tools, llm_client=object(), verbose=False)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Thought: list them\nAction: list_todos[]", ("list them", [("list_todos", "")])),
+    ("Thought: x\nAction: add_todo(buy milk )\nObservation: foo", ("x", [("add_todo", "buy milk")])),
+    ("thought: a\naction: Add_Todo [ x ]", ("a", [("add_todo", "x")])),
+    ("Action: delete_todo[3]", (None, [("delete_todo", "3")])),
+    ("I will. Using add_todo: eggs", (None, [("add_todo", "eggs")])),
+    ("Thought: hmm, no idea", ("hmm, no idea", [])),
+])
+def test_parse_step(agent, text, expected):
+    assert agent._parse_step(text) == expected
+
+
+def test_parse_step_ignores_actions_after_invented_observation(agent):
+    text = (
+        "Thought: look first\nAction: list_todos[]\n"
+        "Observation: Current todos:\n○ [2] b\n"
+        "Thought: remove it\nAction: delete_todo[2]"
+    )
+    assert agent._parse_step(text) == ("look first", [("list_todos", "")])
+
+
+def test_parse_step_returns_every_action(agent):
+    text = "Thought: do both\nAction: add_todo[eggs]\nAction: list_todos[]"
+    assert agent._parse_step(text) == ("do both", [("add_todo", "eggs"), ("list_todos", "")])
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Thought: add it\nAction: add_todo[Call mom (urgent)]", ("add_todo", "Call mom (urgent)")),
+    ("Thought: add it\nAction: add_todo(Call [mom])", ("add_todo", "Call [mom]")),
+    ("Action: add_todo[Call mom (urgent)]", ("add_todo", "Call mom (urgent)")),
+    ("Action: unknown_tool[Call mom (urgent)]", ("unknown_tool", "Call mom (urgent)")),
+])
+def test_parse_step_pairs_brackets(agent, text, expected):
+    assert agent._parse_step(text)[1][0] == expected
+
+
+class RecordingTool(AddTodoTool):
+    """Add tool that stores titles in memory, slowly enough to expose ordering"""
+    
+    def __init__(self, todos):
+        super().__init__()
+        self.todos = todos
+    
+    def execute(self, title: str) -> str:
+        time.sleep(0.05)
+        self.todos.append(title)
+        return f"Successfully added todo: '{title}'"
+
+
+class RecordingListTool(ListTodosTool):
+    def __init__(self, todos):
+        super().__init__()
+        self.todos = todos
+    
+    def execute(self, query: str = "") -> str:
+        return "Current todos: " + ", ".join(self.todos)
+
+
+def test_execute_actions_runs_reads_after_earlier_writes(monkeypatch):
+    monkeypatch.setenv("TOOL_CONCURRENCY_LIMIT", "4")
+    todos = []
+    agent = ReActAgent([RecordingTool(todos), RecordingListTool(todos)], llm_client=object(), verbose=False)
+    
+    observations = agent._execute_actions(
+        [("add_todo", "A"), ("add_todo", "B"), ("list_todos", ""), ("add_todo", "C")]
+    )
+    
+    assert observations[2] in ("Current todos: A, B", "Current todos: B, A")
+    assert observations[3] == "Successfully added todo: 'C'"
+    assert todos[2] == "C"
+
+
+def test_execute_actions_runs_reads_before_later_writes(monkeypatch):
+    monkeypatch.setenv("TOOL_CONCURRENCY_LIMIT", "4")
+    todos = []
+    agent = ReActAgent([RecordingTool(todos), RecordingListTool(todos)], llm_client=object(), verbose=False)
+    
+    observations = agent._execute_actions([("list_todos", ""), ("add_todo", "A")])
+    
+    assert observations == ["Current todos: ", "Successfully added todo: 'A'"]
+
+
+class ScriptedLLM:
+    def __init__(self, replies):
+        self.replies = list(replies)
+    
+    def chat_completion(self, messages, temperature=0.7, stop_pattern=None):
+        return self.replies.pop(0) if self.replies else ""
+
+
+def test_run_keeps_full_history_for_many_actions():
+    todos = []
+    reply = "Thought: add four\n" + "\n".join(f"Action: add_todo[{n}]" for n in "ABCD")
+    agent = ReActAgent([RecordingTool(todos)], llm_client=ScriptedLLM([reply]), max_steps=3,
+                       verbose=False, fast_path=False)
+    
+    history = agent.run("add four todos")["history"]
+    
+    assert [step["type"] for step in history] == (
+        ["thought"] + ["action"] * 4 + ["observation", "answer"]
+    )
+    assert history[0]["content"] == "add four"
+
+
+@pytest.mark.parametrize("question, expected", [
+    ("Show me all the todos", "list_todos[]"),
+    ("list my todos", "list_todos[]"),
+    ("show todo list", "list_todos[]"),
+    ("Add a todo to buy groceries", "add_todo[buy groceries]"),
+    ("add todo \"milk\"", "add_todo[milk]"),
+    ("Add todo: call mom", "add_todo[call mom]"),
+    ("add a new todo called water plants", "add_todo[water plants]"),
+    ("Delete todo with ID 1", "delete_todo[1]"),
+    ("remove todo 12", "delete_todo[12]"),
+    ("delete todo number 3.", "delete_todo[3]"),
+])
+def test_fast_path_matches_single_intent_queries(agent, question, expected):
+    assert agent._try_fast_path(question).endswith(f"Action: {expected}")
+
+
+@pytest.mark.parametrize("question", [
+    "Add eggs to the todo list",
+    "Add buy milk to my todo list",
+    "add a todo list",
+    "add todo to my list",
+    "delete todo buy milk x2",
+    "delete the second one",
+    "Show me how to add a todo",
+    "Add a todo to buy milk and list todos",
+    "show me the weather",
+])
+def test_fast_path_defers_other_queries_to_llm(agent, question):
+    assert agent._try_fast_path(question) is None
+
+
+def _stored_keys(cache):
+    return [row[0] for row in cache._connection().execute("SELECT key FROM cache ORDER BY rowid")]
+
+
+def test_response_cache_drops_oldest_rows(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), maxsize=1, max_rows=2)
+    
+    for key in ("a", "b", "c"):
+        cache.put(key, key.upper())
+    
+    assert _stored_keys(cache) == ["b", "c"]
+    assert cache.get("a") is None
+    assert cache.get("b") == "B"
+
+
+def test_response_cache_rewritten_row_counts_as_newest(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), max_rows=2)
+    
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.put("a", "A2")
+    cache.put("c", "C")
+    
+    assert _stored_keys(cache) == ["a", "c"]
+
+
+def _response(status_code, body=b"", etag=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+class StubSession:
+    """Records requests and answers them from a queue of canned responses"""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+    
+    def _respond(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs.get("headers")))
+        return self.responses.pop(0)
+    
+    def get(self, url, **kwargs):
+        return self._respond("GET", url, **kwargs)
+    
+    def post(self, url, **kwargs):
+        return self._respond("POST", url, **kwargs)
+    
+    def delete(self, url, **kwargs):
+        return self._respond("DELETE", url, **kwargs)
+
+
+TODOS_BODY = orjson.dumps([{"id": 1, "title": "milk", "completed": False}])
+
+
+@pytest.fixture
+def list_cache(monkeypatch):
+    monkeypatch.setattr(react_agent, "_LIST_CACHE", {})
+    return react_agent._LIST_CACHE
+
+
+def test_list_tool_revalidates_with_etag(list_cache):
+    session = StubSession(_response(200, TODOS_BODY, '"v1"'), _response(304, etag='"v1"'))
+    tool = ListTodosTool(session=session)
+    
+    first = tool.execute()
+    second = tool.execute()
+    
+    assert first == second == "Current todos:\n○ [1] milk"
+    assert session.requests == [
+        ("GET", "http://localhost:5001/todos", None),
+        ("GET", "http://localhost:5001/todos", {"If-None-Match": '"v1"'}),
+    ]
+
+
+@pytest.mark.parametrize("tool_class, method, response", [
+    (AddTodoTool, "POST", _response(201, orjson.dumps({"id": 2, "title": "eggs"}))),
+    (DeleteTodoTool, "DELETE", _response(204)),
+])
+def test_write_tools_drop_cached_list(list_cache, tool_class, method, response):
+    session = StubSession(_response(200, TODOS_BODY, '"v1"'), response, _response(200, b"[]", '"v2"'))
+    list_tool = ListTodosTool(session=session)
+    
+    list_tool.execute()
+    tool_class(session=session).execute("2")
+    
+    assert "http://localhost:5001/todos" not in list_cache
+    assert list_tool.execute() == "No todos found. The list is empty."
+    assert session.requests[1][0] == method
+    assert session.requests[2][2] is None
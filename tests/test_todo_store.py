@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+
+
+def test_create_todo_assigns_next_id(store):
+    assert store.create_todo('third')['id'] == 3
+    assert store.create_todo('fourth')['id'] == 4
+
+
+def test_ids_are_not_reused_after_delete(store):
+    assert store.delete_todo(2) is True
+    
+    assert store.create_todo('third')['id'] == 3
+
+
+def test_delete_missing_todo_returns_false(store):
+    assert store.delete_todo(99) is False
+    assert [todo['id'] for todo in store.list_todos()] == [1, 2]
+
+
+def test_list_todos_drops_deleted_todo(store):
+    store.delete_todo(1)
+    
+    assert [todo['id'] for todo in store.list_todos()] == [2]
+    assert store.get_todo(1) is None
+
+
+def test_snapshot_is_cached_until_a_change(store):
+    first = store.snapshot()
+    
+    assert store.snapshot() is first
+
+
+def test_snapshot_etag_changes_on_every_mutation(store):
+    etag = store.snapshot()[1]
+    
+    for mutate in (
+        lambda: store.create_todo('third'),
+        lambda: store.update_todo(3, {'completed': True}),
+        lambda: store.delete_todo(3),
+    ):
+        mutate()
+        new_etag = store.snapshot()[1]
+        assert new_etag != etag
+        etag = new_etag
+
+
+def test_failed_mutations_keep_snapshot(store):
+    first = store.snapshot()
+    
+    assert store.update_todo(99, {'title': 'missing'}) is None
+    assert store.delete_todo(99) is False
+    assert store.snapshot() is first
+
+
+def _saved_titles(store):
+    return [todo['title'] for todo in store.load_todos()]
+
+
+def test_failed_flush_marks_store_dirty_again(store, monkeypatch):
+    def fail(todos):
+        raise OSError("disk full")
+    
+    store.create_todo('third')
+    monkeypatch.setattr(store, 'save_todos', fail)
+    
+    with pytest.raises(OSError):
+        store._flush_pending()
+    assert store._DIRTY.is_set()
+
+
+def test_flush_on_exit_writes_even_when_not_dirty(store):
+    store.create_todo('third')
+    store._DIRTY.clear()
+    
+    store._flush_on_exit()
+    
+    assert _saved_titles(store) == ['first', 'second', 'third']
+
+
+def test_flush_on_exit_waits_for_running_write(store):
+    store.create_todo('third')
+    
+    with store._WRITE_LOCK:
+        exit_flush = threading.Thread(target=store._flush_on_exit)
+        exit_flush.start()
+        exit_flush.join(0.1)
+        assert exit_flush.is_alive()
+    exit_flush.join(1)
+    
+    assert not exit_flush.is_alive()
+    assert _saved_titles(store) == ['first', 'second', 'third']